@@ -5,13 +5,11 @@ import { Loading } from '@components/Loading';
 import { Error as ErrorDisplay } from '@components/Error';
 import { Header } from '@components/Header';
 import { useCache } from '@/hooks/useCache';
-import type { DemographicInsights, EngagementMetrics } from '@types';
 import type { ParsedExcelData } from '@utils/excel/types';
 import '@/App.css';
 
 interface DataState {
-  engagement: EngagementMetrics | null;
-  demographics: DemographicInsights | undefined;
+  data: ParsedExcelData | null;
   uploadDate: number | null;
   isFromCache: boolean;
   error: string | null;
@@ -20,8 +18,7 @@ interface DataState {
 function App() {
   const [loading, setLoading] = useState(false);
   const [state, setState] = useState<DataState>({
-    engagement: null,
-    demographics: undefined,
+    data: null,
     uploadDate: null,
     isFromCache: false,
     error: null,
@@ -63,32 +60,18 @@ function App() {
       return;
     }
 
-    try {
-      const engagementMetrics: EngagementMetrics = {
-        discovery_data: excelData.discovery_data,
-        top_posts: excelData.top_posts,
-        engagementByDay: excelData.engagement_by_day,
-      };
-
-      setState({
-        engagement: engagementMetrics,
-        demographics: excelData.demographics,
-        uploadDate: date ?? Date.now(),
-        isFromCache: fromCache ?? false,
-        error: null,
-      });
-    } catch (err) {
-      setState(prev => ({
-        ...prev,
-        error: err instanceof Error ? err.message : 'Failed to process Excel data'
-      }));
-    }
+    // Parsed data is passed through as-is; the dashboard reads it directly
+    setState({
+      data: excelData,
+      uploadDate: date ?? Date.now(),
+      isFromCache: fromCache ?? false,
+      error: null,
+    });
   };
 
   const resetState = () => {
     setState({
-      engagement: null,
-      demographics: undefined,
+      data: null,
       uploadDate: null,
       isFromCache: false,
       error: null,
@@ -102,7 +85,7 @@ function App() {
   
   const handleLogoClick = () => {
     // If there's any data being displayed, clear the cache
-    if (state.engagement) {
+    if (state.data) {
       handleClearCache();
     } else {
       resetState();
@@ -114,7 +97,7 @@ function App() {
   useEffect(() => {
     const handleKeyDown = (event: KeyboardEvent) => {
       // Escape key - return to homepage
-      if (event.key === 'Escape' && state.engagement) {
+      if (event.key === 'Escape' && state.data) {
         handleClearCache();
         return;
       }
@@ -139,12 +122,12 @@ function App() {
     return () => {
       window.removeEventListener('keydown', handleKeyDown);
     };
-  }, [state.engagement, clearCache]);
+  }, [state.data, clearCache]);
 
   return (
     <div className="app-container">
       <div className="landing-content">
-        {state.engagement && <div className="background-overlay" />}
+        {state.data && <div className="background-overlay" />}
         
         <Header
           onLogoClick={handleLogoClick}
@@ -153,7 +136,7 @@ function App() {
         />
 
         <main className="app-main">
-          {state.engagement && (
+          {state.data && (
             <button
               className="upload-new-data-btn desktop-only"
               onClick={handleClearCache}
@@ -168,13 +151,12 @@ function App() {
 
           {loading && <Loading />}
 
-          {!loading && !state.error && state.engagement ? (
+          {!loading && !state.error && state.data ? (
             <UnifiedDashboard
-              data={state.engagement}
-              demographics={state.demographics}
+              data={state.data}
               onUploadNewData={handleClearCache}
             />
-          ) : !loading && !state.error && !state.engagement ? (
+          ) : !loading && !state.error && !state.data ? (
             <FileUpload onFileProcessed={handleFileProcessed} isLoading={loading} />
           ) : null}
         </main>
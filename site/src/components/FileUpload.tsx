@@ -34,8 +34,8 @@ export const FileUpload: React.FC<FileUploadProps> = ({ onFileProcessed, isLoadi
     if (acceptedFiles.length === 0) return;
 
     try {
-      const { processExcelFile } = await import('@utils/excel/excelProcessor');
-      const data = await processExcelFile(acceptedFiles[0]);
+      const { processExcelFileInWorker } = await import('@utils/excel/excelWorkerClient');
+      const data = await processExcelFileInWorker(acceptedFiles[0]);
       cache.save(data);
       onFileProcessed(data, undefined, Date.now(), false);
     } catch (error) {
@@ -5,36 +5,29 @@ import { DemographicsView } from '@components/DemographicsView';
 import { WrappedStoriesContainer } from '@components/WrappedStories/WrappedStoriesContainer';
 import { FinalMessage } from '@components/FinalMessage';
 import { generateShareableCards } from '@utils/cardDataMapper';
-import type { EngagementMetrics, TopPost, DemographicInsights, DiscoveryData } from '@types';
+import type { TopPost, DiscoveryData } from '@types';
 import type { ParsedExcelData } from '@utils/excel/types';
 import '@styles/UnifiedDashboard.css';
 
 interface UnifiedDashboardProps {
-  data: EngagementMetrics;
-  demographics?: DemographicInsights;
+  data: ParsedExcelData;
   onUploadNewData?: () => void;
 }
 
 export const UnifiedDashboard: React.FC<UnifiedDashboardProps> = ({
   data,
-  demographics,
   onUploadNewData,
 }) => {
   // Extract discovery data if available
   const discoveryData: DiscoveryData | undefined = data.discovery_data;
   const topPosts: TopPost[] = data.top_posts || [];
+  const demographics = data.demographics;
 
   // Generate shareable cards for wrapped stories
   const wrappedCards = useMemo(() => {
     if (!discoveryData) return [];
-    const excelData: ParsedExcelData = {
-      discovery_data: discoveryData,
-      top_posts: data.top_posts,
-      demographics,
-      engagement_by_day: data.engagementByDay,
-    };
-    return generateShareableCards(excelData);
-  }, [discoveryData, data.top_posts, demographics, data.engagementByDay]);
+    return generateShareableCards(data);
+  }, [discoveryData, data]);
 
   return (
     <div className="unified-dashboard">
@@ -51,7 +44,7 @@ export const UnifiedDashboard: React.FC<UnifiedDashboardProps> = ({
       {discoveryData && (
         <SpotifyDashboard
           discovery={discoveryData}
-          engagementByDay={data.engagementByDay}
+          engagementByDay={data.engagement_by_day}
         />
       )}
 
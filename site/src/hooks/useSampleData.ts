@@ -23,8 +23,8 @@ export function useSampleData(
         type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
       });
 
-      const { processExcelFile } = await import('@utils/excel/excelProcessor');
-      const data = await processExcelFile(file);
+      const { processExcelFileInWorker } = await import('@utils/excel/excelWorkerClient');
+      const data = await processExcelFileInWorker(file);
       onDataLoaded(data);
     } catch (err) {
       onError(err instanceof Error ? err : new Error('Failed to load sample data'));
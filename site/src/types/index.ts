@@ -1,17 +1,3 @@
-export interface EngagementMetrics {
-  discovery_data?: {
-    start_date: string;
-    end_date: string;
-    total_impressions: number;
-    members_reached: number;
-    total_engagements?: number;
-    average_impressions_per_day?: number;
-    new_followers?: number;
-  };
-  top_posts?: TopPost[];
-  engagementByDay?: EngagementByDay[];
-}
-
 // Re-export DiscoveryData from excel types for convenience
 export type { DiscoveryData } from '@utils/excel/types';
 
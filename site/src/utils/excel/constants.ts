@@ -18,6 +18,11 @@ export const MAX_ROWS = {
   FOLLOWERS: 500,
 };
 
+/**
+ * Number of top posts kept after parsing (the dashboard displays six)
+ */
+export const TOP_POSTS_LIMIT = 6;
+
 /**
  * Criteria for detecting when to stop scanning
  */
@@ -37,6 +42,18 @@ export const SHEET_NAMES = {
   ENGAGEMENT: ['ENGAGEMENT'],
 };
 
+/**
+ * Options passed to XLSX.read
+ * Only the sheets listed in SHEET_NAMES are parsed (SheetJS matches names case-insensitively),
+ * and formatted text/HTML generation is skipped since parsers only read raw cell values (`.v`)
+ */
+export const READ_OPTIONS = {
+  sheets: Object.values(SHEET_NAMES).flat(),
+  cellText: false,
+  cellHTML: false,
+  cellFormula: false,
+};
+
 /**
  * Column layouts for different sheet types
  */
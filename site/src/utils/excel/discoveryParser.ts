@@ -21,6 +21,11 @@ import {
 } from '@utils/excel/utils';
 import { SHEET_NAMES } from '@utils/excel/constants';
 
+/**
+ * Date range in B1, e.g. "01/01/2025 - 12/31/2025"
+ */
+const DATE_RANGE_PATTERN = /(\d{1,2}\/\d{1,2}\/\d{4})\s*-\s*(\d{1,2}\/\d{1,2}\/\d{4})/;
+
 /**
  * Parse the Discovery sheet to extract overall performance metrics
  * Sheet has fixed structure with all data in column B:
@@ -40,8 +45,11 @@ export function parseDiscovery(workbook: WorkBook): DiscoveryData | undefined {
 
   try {
     // Read date range from B1 (format: "MM/DD/YYYY - MM/DD/YYYY")
-    const dateRangeCell = getCellValue(sheet, 'B1');
-    const [startStr, endStr] = String(dateRangeCell || '').split('-').map((s: string) => s.trim());
+    const dateRangeCell = String(getCellValue(sheet, 'B1') || '');
+    const rangeMatch = DATE_RANGE_PATTERN.exec(dateRangeCell);
+    const [startStr, endStr] = rangeMatch
+      ? [rangeMatch[1], rangeMatch[2]]
+      : dateRangeCell.split('-').map((s: string) => s.trim());
     
     // Read impressions from B2
     const impressionsValue = getCellValue(sheet, 'B2');
@@ -53,20 +61,18 @@ export function parseDiscovery(workbook: WorkBook): DiscoveryData | undefined {
     const end_date = parseDate(endStr);
     const total_impressions = parseNumber(impressionsValue);
 
-    const discoveryData: DiscoveryData = {
+    // Calculate average impressions per day if we have valid dates
+    const average_impressions_per_day = start_date && end_date && total_impressions > 0
+      ? Math.round(total_impressions / calculateDateRangeDays(start_date, end_date))
+      : undefined;
+
+    return {
       start_date,
       end_date,
       total_impressions,
       members_reached: parseNumber(membersValue),
+      average_impressions_per_day,
     };
-
-    // Calculate average impressions per day if we have valid dates
-    if (start_date && end_date && total_impressions > 0) {
-      const daysDiff = calculateDateRangeDays(start_date, end_date);
-      discoveryData.average_impressions_per_day = Math.round(total_impressions / daysDiff);
-    }
-
-    return discoveryData;
   } catch (error) {
     console.error('Error parsing DISCOVERY sheet:', error);
     return undefined;
@@ -15,7 +15,7 @@
  * - Column C: Engagements
  *
  * Performance Notes:
- * - Single pass through rows
+ * - Single pass through rows, reading each cell once
  * - ~5-15ms processing time typical
  * - Memory efficient
  *
@@ -31,8 +31,7 @@ import {
   parseNumber, 
   findSheet,
   findRowWithKeywords,
-  iterateRowsUntilEmpty,
-  getRowValues
+  iterateRowValuesUntilEmpty
 } from '@utils/excel/utils';
 import { SHEET_NAMES, COLUMN_LAYOUTS, KEYWORDS, MAX_ROWS } from '@utils/excel/constants';
 
@@ -62,17 +61,15 @@ export function parseEngagement(workbook: WorkBook): EngagementByDay[] {
       return [];
     }
 
-    // Parse data rows using iterator
-    for (const row of iterateRowsUntilEmpty(sheet, headerRow + 1, columns, MAX_ROWS.DATA)) {
-      const values = getRowValues(sheet, row, columns);
-      
-      const date = parseDate(values[layout.DATE]);
+    // Parse data rows using iterator (values come back in columns order)
+    for (const [dateValue, impressions, engagements] of iterateRowValuesUntilEmpty(sheet, headerRow + 1, columns, MAX_ROWS.DATA)) {
+      const date = parseDate(dateValue);
       if (!date) continue;
 
       engagementData.push({
         date,
-        engagement: parseNumber(values[layout.ENGAGEMENTS]),
-        impressions: parseNumber(values[layout.IMPRESSIONS]),
+        engagement: parseNumber(engagements),
+        impressions: parseNumber(impressions),
       });
     }
 
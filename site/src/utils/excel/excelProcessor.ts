@@ -10,7 +10,7 @@
  * 2. Read file as ArrayBuffer
  * 3. Parse using XLSX library
  * 4. Delegate to specific sheet parsers
- * 5. Aggregate and return all parsed data
+ * 5. Aggregate and return all parsed data (built once, never mutated afterwards)
  *
  * Performance Characteristics:
  * - File reading: ~100-500ms (depends on file size)
@@ -40,6 +40,7 @@ import { parseTopPosts } from '@utils/excel/topPostsParser';
 import { parseDemographics } from '@utils/excel/demographicsParser';
 import { parseEngagement, calculateTotalEngagements, calculateMedianDailyImpressions } from '@utils/excel/engagementParser';
 import { parseFollowers } from '@utils/excel/followersParser';
+import { READ_OPTIONS } from '@utils/excel/constants';
 
 /**
  * Process an Excel file and extract all LinkedIn analytics data
@@ -68,8 +69,8 @@ export async function processExcelFile(file: File): Promise<ParsedExcelData> {
 
     // Step 2: Parse workbook using XLSX
     // type: 'array' tells XLSX to expect Uint8Array/ArrayBuffer
-    // This reads cell values, not formulas
-    const workbook = XLSX.read(arrayBuffer, { type: 'array' });
+    // Only the sheets we parse are read, and only their raw cell values (no formulas or formatted text)
+    const workbook = XLSX.read(arrayBuffer, { type: 'array', ...READ_OPTIONS });
 
     // Validate workbook
     if (!workbook.SheetNames || workbook.SheetNames.length === 0) {
@@ -82,29 +83,10 @@ export async function processExcelFile(file: File): Promise<ParsedExcelData> {
     // Step 4: Parse each sheet type (all are optional - some sheets may not exist)
 
     // Parse discovery data (overall performance metrics)
-    let discoveryData = parseDiscovery(workbook);
-    if (discoveryData) {
-      parsedData.discovery_data = discoveryData;
-    }
+    const discoveryData = parseDiscovery(workbook);
 
     // Parse followers data (new followers count)
     const newFollowers = parseFollowers(workbook);
-    if (newFollowers !== undefined) {
-      if (discoveryData) {
-        // Merge followers data into existing discovery data
-        discoveryData.new_followers = newFollowers;
-      } else {
-        // Create minimal discovery data if it doesn't exist
-        discoveryData = {
-          start_date: '',
-          end_date: '',
-          total_impressions: 0,
-          members_reached: 0,
-          new_followers: newFollowers,
-        };
-        parsedData.discovery_data = discoveryData;
-      }
-    }
 
     // Parse Top posts (individual post metrics)
     const topPosts = parseTopPosts(workbook);
@@ -120,15 +102,26 @@ export async function processExcelFile(file: File): Promise<ParsedExcelData> {
 
     // Parse engagement metrics (engagement time series with impressions)
     const engagementByDay = parseEngagement(workbook);
-    if (engagementByDay && engagementByDay.length > 0) {
+    const hasEngagement = engagementByDay && engagementByDay.length > 0;
+    if (hasEngagement) {
       parsedData.engagement_by_day = engagementByDay;
+    }
 
-      // Update discovery data with metrics calculated from engagement data
-      // This is more accurate than the discovery sheet values
-      if (discoveryData) {
-        discoveryData.total_engagements = calculateTotalEngagements(engagementByDay);
-        discoveryData.average_impressions_per_day = Math.round(calculateMedianDailyImpressions(engagementByDay));
-      }
+    // Step 5: Build discovery data in one object literal so every result has the same fixed shape
+    // Created if either the discovery or followers sheet exists (minimal data if only followers exist)
+    // Metrics calculated from engagement data are more accurate than the discovery sheet values
+    if (discoveryData || newFollowers !== undefined) {
+      parsedData.discovery_data = {
+        start_date: discoveryData?.start_date ?? '',
+        end_date: discoveryData?.end_date ?? '',
+        total_impressions: discoveryData?.total_impressions ?? 0,
+        members_reached: discoveryData?.members_reached ?? 0,
+        total_engagements: hasEngagement ? calculateTotalEngagements(engagementByDay) : undefined,
+        average_impressions_per_day: hasEngagement
+          ? Math.round(calculateMedianDailyImpressions(engagementByDay))
+          : discoveryData?.average_impressions_per_day,
+        new_followers: newFollowers,
+      };
     }
 
     return parsedData;
@@ -0,0 +1,21 @@
+/**
+ * Excel Worker
+ * ============
+ * Runs processExcelFile in a Web Worker so parsing large exports doesn't block the UI thread.
+ *
+ * Protocol:
+ * - Receives the uploaded File
+ * - Posts back { data } on success or { error } with the error message on failure
+ */
+import { processExcelFile } from '@utils/excel/excelProcessor';
+import type { ExcelWorkerResponse } from '@utils/excel/types';
+
+self.addEventListener('message', async (event: MessageEvent<File>) => {
+  let response: ExcelWorkerResponse;
+  try {
+    response = { data: await processExcelFile(event.data) };
+  } catch (error) {
+    response = { error: error instanceof Error ? error.message : 'Failed to process Excel file' };
+  }
+  self.postMessage(response);
+});
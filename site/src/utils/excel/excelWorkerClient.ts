@@ -0,0 +1,42 @@
+/**
+ * Excel Worker Client
+ * ===================
+ * Main-thread entry point that hands an Excel file to the Excel worker and resolves with its result.
+ *
+ * - A new worker is started per file and terminated once it responds
+ * - Falls back to parsing on the main thread when Web Workers are unavailable
+ */
+import type { ExcelWorkerResponse, ParsedExcelData } from '@utils/excel/types';
+
+/**
+ * Process an Excel file in a Web Worker
+ * @param file - The Excel file to process (from file input or drag-drop)
+ * @returns Promise resolving to ParsedExcelData with all extracted analytics
+ * @throws Error if the file could not be processed
+ */
+export function processExcelFileInWorker(file: File): Promise<ParsedExcelData> {
+  if (typeof Worker === 'undefined') {
+    return import('@utils/excel/excelProcessor').then(({ processExcelFile }) => processExcelFile(file));
+  }
+
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(new URL('./excelWorker.ts', import.meta.url), { type: 'module' });
+
+    worker.onmessage = (event: MessageEvent<ExcelWorkerResponse>) => {
+      worker.terminate();
+      const { data, error } = event.data;
+      if (data) {
+        resolve(data);
+      } else {
+        reject(new Error(error || 'Failed to process Excel file'));
+      }
+    };
+
+    worker.onerror = (event: ErrorEvent) => {
+      worker.terminate();
+      reject(new Error(event.message || 'Failed to process Excel file'));
+    };
+
+    worker.postMessage(file);
+  });
+}
@@ -14,6 +14,7 @@
 
 // Main processor
 export { processExcelFile } from '@utils/excel/excelProcessor';
+export { processExcelFileInWorker } from '@utils/excel/excelWorkerClient';
 
 // Types
 export type {
@@ -41,10 +42,9 @@ export {
   findSheet,
   containsKeyword,
   findRowWithKeywords,
-  iterateRowsUntilEmpty,
-  getRowValues,
+  iterateRowValuesUntilEmpty,
 } from '@utils/excel/utils';
 
 // Constants (for reference or customization)
-export { MAX_ROWS, SCAN_LIMITS, SHEET_NAMES, COLUMN_LAYOUTS, KEYWORDS } from '@utils/excel/constants';
+export { MAX_ROWS, TOP_POSTS_LIMIT, SCAN_LIMITS, SHEET_NAMES, COLUMN_LAYOUTS, KEYWORDS } from '@utils/excel/constants';
 
@@ -18,7 +18,9 @@
  *
  * Performance Notes:
  * - Uses Map for O(1) URL deduplication
- * - Single pass through rows
+ * - Posts are stored column-wise; objects are only created for the selected top posts
+ * - Single pass through rows, reading each cell once
+ * - Top posts are selected in O(N) with a fixed-size buffer instead of sorting every post
  * - ~5-50ms processing time depending on post count
  * - Memory efficient: only stores unique URLs
  */
@@ -30,16 +32,21 @@ import {
   parseURL, 
   findSheet,
   findRowWithKeywords,
-  iterateRowsUntilEmpty,
-  getRowValues
+  iterateRowValuesUntilEmpty
 } from '@utils/excel/utils';
-import { SHEET_NAMES, COLUMN_LAYOUTS, KEYWORDS, MAX_ROWS } from '@utils/excel/constants';
+import { SHEET_NAMES, COLUMN_LAYOUTS, KEYWORDS, MAX_ROWS, TOP_POSTS_LIMIT } from '@utils/excel/constants';
 
-interface PostData {
-  url: string;
-  date: string;
-  engagements: number;
-  impressions: number;
+/**
+ * Parsed posts stored column-wise (one array per field, aligned by index)
+ * Avoids allocating an object per post; objects are only built for the selected top posts
+ */
+interface PostColumns {
+  /** URL -> index into the arrays below, for O(1) deduplication */
+  indexByUrl: Map<string, number>;
+  urls: string[];
+  dates: string[];
+  engagements: number[];
+  impressions: number[];
 }
 
 /**
@@ -48,57 +55,79 @@ interface PostData {
 type MetricType = 'engagements' | 'impressions';
 
 /**
- * Column configuration for a metric side (left or right)
- */
-interface MetricColumns {
-  URL: string;
-  DATE: string;
-  VALUE: string;
-}
-
-/**
- * Process a single post entry and update the posts map
- * @param postsMap - Map storing all posts indexed by URL
- * @param columns - Column configuration for this metric type
- * @param rowValues - Values from the current row
+ * Process a single post entry and update the post columns
+ * @param posts - Column-wise storage of all posts
+ * @param urlValue - Raw URL cell value
+ * @param dateValue - Raw publish date cell value
+ * @param metricValue - Raw metric cell value
  * @param metricType - Type of metric being processed
  */
 function processPostEntry(
-  postsMap: Map<string, PostData>,
-  columns: MetricColumns,
-  rowValues: Record<string, any>,
+  posts: PostColumns,
+  urlValue: any,
+  dateValue: any,
+  metricValue: any,
   metricType: MetricType
 ): void {
-  const url = parseURL(rowValues[columns.URL]);
+  const url = parseURL(urlValue);
   if (!url) return;
 
-  const date = parseDate(rowValues[columns.DATE]);
-  const metric = parseNumber(rowValues[columns.VALUE]);
+  const date = parseDate(dateValue);
+  const metric = parseNumber(metricValue);
 
   // Get or create post entry
-  if (!postsMap.has(url)) {
-    postsMap.set(url, {
-      url,
-      date,
-      engagements: 0,
-      impressions: 0,
-    });
+  let index = posts.indexByUrl.get(url);
+  if (index === undefined) {
+    index = posts.urls.length;
+    posts.indexByUrl.set(url, index);
+    posts.urls.push(url);
+    posts.dates.push(date);
+    posts.engagements.push(0);
+    posts.impressions.push(0);
   }
 
   // Update post with new metric (use max value if duplicate)
-  const post = postsMap.get(url)!;
-  post[metricType] = Math.max(post[metricType], metric);
+  const metrics = posts[metricType];
+  metrics[index] = Math.max(metrics[index], metric);
   
   // Update date if not already set
-  if (!post.date && date) {
-    post.date = date;
+  if (!posts.dates[index] && date) {
+    posts.dates[index] = date;
+  }
+}
+
+/**
+ * Select the posts with the most engagements without sorting every post
+ * Keeps a small buffer of indices ordered by engagements (descending); ties keep spreadsheet order
+ * @param engagements - Engagements of all parsed posts, in spreadsheet order
+ * @param count - Number of posts to keep
+ * @returns Indices of up to `count` posts, highest engagements first
+ */
+function selectTopPosts(engagements: number[], count: number): number[] {
+  const top: number[] = [];
+
+  for (let post = 0; post < engagements.length; post++) {
+    const value = engagements[post];
+    if (top.length === count && value <= engagements[top[count - 1]]) {
+      continue;
+    }
+
+    // Insert into place, dropping the last entry if the buffer is full
+    let i = Math.min(top.length, count - 1);
+    while (i > 0 && engagements[top[i - 1]] < value) {
+      top[i] = top[i - 1];
+      i--;
+    }
+    top[i] = post;
   }
+
+  return top;
 }
 
 /**
  * Parse the Top posts sheet to extract top performing posts
  * @param workbook - Parsed Excel workbook from xlsx library
- * @returns Array of TopPost objects in the order they appear in the spreadsheet (already sorted by engagement)
+ * @returns Up to TOP_POSTS_LIMIT TopPost objects, ranked by engagements
  */
 export function parseTopPosts(workbook: WorkBook): TopPost[] {
   const sheet = findSheet(workbook, SHEET_NAMES.TOP_POSTS);
@@ -108,8 +137,14 @@ export function parseTopPosts(workbook: WorkBook): TopPost[] {
   }
 
   try {
-    // Use Map to deduplicate posts by URL
-    const postsMap = new Map<string, PostData>();
+    // Store posts column-wise, deduplicated by URL
+    const posts: PostColumns = {
+      indexByUrl: new Map(),
+      urls: [],
+      dates: [],
+      engagements: [],
+      impressions: [],
+    };
 
     // Find header row
     const headerRow = findRowWithKeywords(sheet, ['A', 'B'], KEYWORDS.HEADERS.URL);
@@ -128,24 +163,24 @@ export function parseTopPosts(workbook: WorkBook): TopPost[] {
       layout.IMPRESSIONS.VALUE
     ];
 
-    // Process data rows using iterator
-    for (const row of iterateRowsUntilEmpty(sheet, headerRow + 1, allColumns, MAX_ROWS.DATA)) {
-      const values = getRowValues(sheet, row, allColumns);
+    // Process data rows using iterator (values come back in allColumns order)
+    for (const values of iterateRowValuesUntilEmpty(sheet, headerRow + 1, allColumns, MAX_ROWS.DATA)) {
+      const [engUrl, engDate, engagements, impUrl, impDate, impressions] = values;
 
       // Process left side (Engagements)
-      processPostEntry(postsMap, layout.ENGAGEMENTS, values, 'engagements');
+      processPostEntry(posts, engUrl, engDate, engagements, 'engagements');
 
       // Process right side (Impressions)
-      processPostEntry(postsMap, layout.IMPRESSIONS, values, 'impressions');
+      processPostEntry(posts, impUrl, impDate, impressions, 'impressions');
     }
 
-    // Convert map to array with ranks
-    return Array.from(postsMap.values()).map((post, index) => ({
+    // Keep the top posts by engagements and assign ranks
+    return selectTopPosts(posts.engagements, TOP_POSTS_LIMIT).map((post, index) => ({
       rank: index + 1,
-      url: post.url,
-      publish_date: post.date,
-      engagements: post.engagements,
-      impressions: post.impressions,
+      url: posts.urls[post],
+      publish_date: posts.dates[post],
+      engagements: posts.engagements[post],
+      impressions: posts.impressions[post],
     }));
   } catch (error) {
     console.error('Error parsing Top posts sheet:', error);
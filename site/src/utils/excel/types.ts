@@ -5,13 +5,13 @@
 import type { TopPost } from '@types';
 
 export interface DiscoveryData {
-  start_date: string;
-  end_date: string;
-  total_impressions: number;
-  members_reached: number;
-  total_engagements?: number;
-  average_impressions_per_day?: number;
-  new_followers?: number;
+  readonly start_date: string;
+  readonly end_date: string;
+  readonly total_impressions: number;
+  readonly members_reached: number;
+  readonly total_engagements?: number;
+  readonly average_impressions_per_day?: number;
+  readonly new_followers?: number;
 }
 
 export interface DemographicItem {
@@ -40,3 +40,11 @@ export interface ParsedExcelData {
   demographics?: DemographicInsights;
   engagement_by_day?: EngagementByDay[];
 }
+
+/**
+ * Message posted back by the Excel worker
+ */
+export interface ExcelWorkerResponse {
+  data?: ParsedExcelData;
+  error?: string;
+}
@@ -6,6 +6,28 @@
 import type { WorkSheet, WorkBook } from 'xlsx';
 import { MAX_ROWS, SCAN_LIMITS, EXCEL_DATE_OFFSET, MS_PER_DAY, MIN_PERCENTAGE } from '@utils/excel/constants';
 
+// Patterns used when parsing cell values, compiled once at module load rather than on every cell
+
+/**
+ * US-style date as exported by LinkedIn (e.g. "1/5/2025" or "01/05/2025")
+ */
+const US_DATE_PATTERN = /^(\d{1,2})\/(\d{1,2})\/(\d{4})$/;
+
+/**
+ * Anything that isn't a digit (thousands separators, spaces, etc.)
+ */
+const NON_DIGIT_PATTERN = /[^\d]/g;
+
+/**
+ * Anything that isn't part of a decimal number
+ */
+const NON_DECIMAL_PATTERN = /[^\d.]/g;
+
+/**
+ * First http(s) URL in a cell
+ */
+const URL_PATTERN = /https?:\/\/[^\s"]+/;
+
 /**
  * Get cell value safely from a worksheet
  * @param sheet - The worksheet to read from
@@ -47,7 +69,7 @@ export function parsePercentage(value: any): number {
   }
 
   // Extract all digits and decimal points
-  const cleaned = value.replace(/[^\d.]/g, '');
+  const cleaned = value.replace(NON_DECIMAL_PATTERN, '');
   const parsed = parseFloat(cleaned);
 
   // Convert percentage to decimal (e.g., "1" → 0.01, "50" → 0.5)
@@ -62,42 +84,60 @@ export function parsePercentage(value: any): number {
 export function parseDate(value: any): string {
   if (!value) return '';
 
-  // If it's already a date, format it
-  if (value instanceof Date) {
-    return value.toISOString().split('T')[0];
-  }
+  // Dispatch on typeof once; the Date instanceof check only runs for objects
+  switch (typeof value) {
+    // If it's a string, try to parse it
+    case 'string': {
+      // Fast path for LinkedIn's MM/DD/YYYY format: build the ISO string directly
+      // (avoids Date parsing and the local-time -> UTC shift of toISOString)
+      const match = US_DATE_PATTERN.exec(value.trim());
+      if (match) {
+        const [, month, day, year] = match;
+        const m = Number(month);
+        const d = Number(day);
+        // Only take the fast path for real calendar dates (e.g. not 2/30); others fall through
+        if (m >= 1 && m <= 12 && d >= 1 && new Date(Date.UTC(Number(year), m - 1, d)).getUTCDate() === d) {
+          return `${year}-${month.padStart(2, '0')}-${day.padStart(2, '0')}`;
+        }
+      }
 
-  // If it's a string, try to parse it
-  if (typeof value === 'string') {
-    const date = new Date(value);
-    if (!isNaN(date.getTime())) {
-      return date.toISOString().split('T')[0];
+      const date = new Date(value);
+      if (!isNaN(date.getTime())) {
+        return date.toISOString().split('T')[0];
+      }
+      return value;
     }
-    return value;
-  }
 
-  // If it's a number (Excel serial date), convert it
-  if (typeof value === 'number') {
-    // Excel stores dates as number of days since 1900-01-01
-    const excelDate = new Date((value - EXCEL_DATE_OFFSET) * MS_PER_DAY);
-    return excelDate.toISOString().split('T')[0];
-  }
+    // If it's a number (Excel serial date), convert it
+    case 'number': {
+      // Excel stores dates as number of days since 1900-01-01
+      const excelDate = new Date((value - EXCEL_DATE_OFFSET) * MS_PER_DAY);
+      return excelDate.toISOString().split('T')[0];
+    }
+
+    // If it's already a date, format it
+    case 'object':
+      return value instanceof Date ? value.toISOString().split('T')[0] : '';
 
-  return '';
+    default:
+      return '';
+  }
 }
 
 /**
  * Parse number values safely
  */
 export function parseNumber(value: any): number {
-  if (typeof value === 'number') {
-    return value;
-  }
-  if (typeof value === 'string') {
-    const parsed = parseInt(value.replace(/[^\d]/g, ''), 10);
-    return isNaN(parsed) ? 0 : parsed;
+  switch (typeof value) {
+    case 'number':
+      return value;
+    case 'string': {
+      const parsed = parseInt(value.replace(NON_DIGIT_PATTERN, ''), 10);
+      return isNaN(parsed) ? 0 : parsed;
+    }
+    default:
+      return 0;
   }
-  return 0;
 }
 
 /**
@@ -129,7 +169,7 @@ export function parseURL(value: any): string {
   if (!value) return '';
   if (typeof value === 'string') {
     // Try to extract URL if it's in a common format
-    const urlMatch = value.match(/https?:\/\/[^\s"]+/);
+    const urlMatch = value.match(URL_PATTERN);
     return urlMatch ? urlMatch[0] : value;
   }
   return String(value);
@@ -174,28 +214,28 @@ export function findRowWithKeywords(
 }
 
 /**
- * Iterator that yields rows until a stopping condition is met
- * Stops after encountering consecutive empty rows
+ * Iterator that yields the values of each row until a stopping condition is met
+ * Stops after encountering consecutive empty rows; every cell is read only once
  * @param sheet - The worksheet to iterate
  * @param startRow - Starting row number
- * @param columns - Array of column letters to check for emptiness
+ * @param columns - Array of column letters to read (and check for emptiness)
  * @param maxRow - Maximum row to scan
  * @param maxEmptyRows - Number of consecutive empty rows before stopping
+ * @returns Array of cell values in the same order as `columns`
  */
-export function* iterateRowsUntilEmpty(
+export function* iterateRowValuesUntilEmpty(
   sheet: WorkSheet,
   startRow: number,
   columns: string[],
   maxRow: number = MAX_ROWS.DATA,
   maxEmptyRows: number = SCAN_LIMITS.CONSECUTIVE_EMPTY_ROWS
-): Generator<number> {
+): Generator<any[]> {
   let emptyRowCount = 0;
 
   for (let row = startRow; row <= maxRow; row++) {
-    // Check if all specified columns are empty
-    const isEmpty = columns.every(col => !getCellValue(sheet, `${col}${row}`));
+    const values = columns.map(col => getCellValue(sheet, `${col}${row}`));
 
-    if (isEmpty) {
+    if (values.every(value => !value)) {
       emptyRowCount++;
       if (emptyRowCount >= maxEmptyRows) {
         break;
@@ -204,25 +244,6 @@ export function* iterateRowsUntilEmpty(
     }
 
     emptyRowCount = 0;
-    yield row;
-  }
-}
-
-/**
- * Get values from multiple columns in a single row
- * @param sheet - The worksheet to read from
- * @param row - Row number
- * @param columns - Array of column letters
- * @returns Object mapping column letters to their values
- */
-export function getRowValues(
-  sheet: WorkSheet,
-  row: number,
-  columns: string[]
-): Record<string, any> {
-  const result: Record<string, any> = {};
-  for (const col of columns) {
-    result[col] = getCellValue(sheet, `${col}${row}`);
+    yield values;
   }
-  return result;
 }
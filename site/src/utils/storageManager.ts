@@ -6,11 +6,33 @@ export interface CachedData {
 }
 
 const CACHE_KEY = 'wrapped-for-linkedin-cache';
+// Cached uploads older than this are evicted instead of being shown again
+const CACHE_TTL_MS = 7 * 24 * 60 * 60 * 1000;
+
+// Last serialized entry and its parsed form, so repeated loads of the same entry skip JSON.parse
+let memo: { raw: string; parsed: CachedData } | null = null;
+
+const parseCachedItem = (raw: string): CachedData => {
+  if (memo && memo.raw === raw) {
+    return memo.parsed;
+  }
+  const parsed = JSON.parse(raw) as CachedData;
+  memo = { raw, parsed };
+  return parsed;
+};
 
 const getCachedItem = (): CachedData | null => {
   try {
     const cached = localStorage.getItem(CACHE_KEY);
-    return cached ? (JSON.parse(cached) as CachedData) : null;
+    if (!cached) return null;
+
+    const parsed = parseCachedItem(cached);
+    if (typeof parsed.uploadDate !== 'number' || Date.now() - parsed.uploadDate > CACHE_TTL_MS) {
+      localStorage.removeItem(CACHE_KEY);
+      memo = null;
+      return null;
+    }
+    return parsed;
   } catch (error) {
     console.error('Failed to load cache:', error);
     return null;
@@ -29,6 +51,7 @@ export const storageManager = {
   load: (): CachedData | null => getCachedItem(),
 
   clear: (): void => {
+    memo = null;
     try {
       localStorage.removeItem(CACHE_KEY);
     } catch (error) {